@@ -162,6 +162,8 @@ class Array(
             self._dynamic_backend = dynamic_backend
         else:
             self._dynamic_backend = ivy.get_dynamic_backend()
+        if self._dynamic_backend:
+            ivy.utils.backend.handler._track_array(self)
 
     def _view_attributes(self, data):
         if hasattr(data, "base"):
@@ -206,6 +208,8 @@ class Array(
                 np_data = to_numpy(self.data)
                 self._data = ivy.array(np_data).data
 
+            ivy.utils.backend.handler._track_array(self)
+
         self._dynamic_backend = value
 
     @property
@@ -392,6 +396,8 @@ class Array(
         ivy.unset_backend()
 
         self.__dict__ = ivy_array.__dict__
+        if self._dynamic_backend:
+            ivy.utils.backend.handler._track_array(self)
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
@@ -161,6 +161,7 @@ class ContainerBase(dict, abc.ABC):
         )
         self._config = dict()
         self.cont_inplace_update(dict_in, **self._config_in)
+        ivy.utils.backend.handler._track_container(self)
 
     # Class Methods #
     # --------------#
@@ -4074,6 +4075,8 @@ class ContainerBase(dict, abc.ABC):
             def _set_dyn_backend(obj, val):
                 if isinstance(obj, ivy.Array):
                     obj._dynamic_backend = val
+                    if val:
+                        ivy.utils.backend.handler._track_array(obj)
                     return
 
                 if isinstance(obj, ivy.Container):
@@ -4130,6 +4133,7 @@ class ContainerBase(dict, abc.ABC):
                     config["ivyh"] = ivy.get_backend(config["ivyh"])
             state_dict["_config"] = config
         self.__dict__.update(state_dict)
+        ivy.utils.backend.handler._track_container(self)
 
     # Getters and Setters #
     # --------------------#
@@ -990,3 +990,4 @@ class Container(
                         config["ivyh"] = ivy
             state_dict["_config"] = config
         self.__dict__.update(state_dict)
+        ivy.utils.backend.handler._track_container(self)
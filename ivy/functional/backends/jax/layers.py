@@ -1,6 +1,8 @@
 """Collection of Jax network layers, wrapped to fit Ivy syntax and signature."""
 
 # global
+import functools
+import jax
 import jax.lax as jlax
 import jax.numpy as jnp
 
@@ -15,6 +17,68 @@ from ivy.functional.ivy.layers import (
 )
 
 
+_DN_1D = ("NWC", "WIO", "NWC")
+_DN_1D_TRANSPOSE = ("NWC", "WOI", "NWC")
+_DN_2D = ("NHWC", "HWIO", "NHWC")
+_DN_2D_TRANSPOSE = ("NHWC", "HWOI", "NHWC")
+_DN_3D = ("NDHWC", "DHWIO", "NDHWC")
+_DN_3D_TRANSPOSE = ("NDHWC", "DHWOI", "NDHWC")
+
+
+@functools.lru_cache(maxsize=32)
+def _repeat(x, n):
+    return (x,) * n
+
+
+def _ntuple(x, n):
+    if isinstance(x, int):
+        return _repeat(x, n)
+    return tuple(x)
+
+
+def _channel_first_to_last(x, dims):
+    return jnp.transpose(x, (0, *range(2, dims + 2), 1))
+
+
+def _channel_last_to_first(x, dims):
+    return jnp.transpose(x, (0, dims + 1, *range(1, dims + 1)))
+
+
+def _hashable_padding(padding):
+    return padding if isinstance(padding, str) else tuple(map(tuple, padding))
+
+
+@functools.lru_cache(maxsize=128)
+def _jitted_conv(
+    dimension_numbers, channel_first, strides, padding, dilations, transpose=False
+):
+    # XLA prefers channel-last layouts, so channel-first inputs are transposed
+    # around the convolution rather than convolved in their own layout, all
+    # within one compiled function per set of hyperparameters
+    dims = len(strides)
+
+    def _conv(x, filters):
+        if channel_first:
+            x = _channel_first_to_last(x, dims)
+        if transpose:
+            res = jlax.conv_transpose(
+                x, filters, strides, padding, dilations, dimension_numbers, True
+            )
+        else:
+            res = jlax.conv_general_dilated(
+                x, filters, strides, padding, None, dilations, dimension_numbers
+            )
+        if channel_first:
+            return _channel_last_to_first(res, dims)
+        return res
+
+    return jax.jit(_conv)
+
+
+def _swapped_filter_shape(filters):
+    return (*filters.shape[:-2], filters.shape[-1], filters.shape[-2])
+
+
 def _transpose_padding_helper(k, s, padding, dilation, diff=0):
     k = (k - 1) * dilation + 1
     if padding == "SAME":
@@ -63,11 +127,11 @@ def conv1d(
     dilations: Union[int, Tuple[int]] = 1,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    strides = (strides,) if isinstance(strides, int) else strides
-    dilations = (dilations,) if isinstance(dilations, int) else dilations
-    return jlax.conv_general_dilated(
-        x, filters, strides, padding, None, dilations, (data_format, "WIO", data_format)
-    )
+    strides = _ntuple(strides, 1)
+    dilations = _ntuple(dilations, 1)
+    return _jitted_conv(
+        _DN_1D, data_format == "NCW", strides, _hashable_padding(padding), dilations
+    )(x, filters)
 
 
 def conv1d_transpose(
@@ -82,25 +146,29 @@ def conv1d_transpose(
     dilations: Union[int, Tuple[int]] = 1,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    strides = (strides,) if isinstance(strides, int) else strides
-    dilations = (dilations,) if isinstance(dilations, int) else dilations
-    filters = jnp.swapaxes(filters, -1, -2)
+    strides = _ntuple(strides, 1)
+    dilations = _ntuple(dilations, 1)
     if data_format == "NWC":
         x_shape = list(x.shape[1:2])
     else:
         x_shape = list(x.shape[2:])
     padding = _get_tranpose_padding(
-        x_shape, filters.shape, strides, padding, 1, dilations, output_shape
-    )
-    return jlax.conv_transpose(
-        x,
-        filters,
+        x_shape,
+        _swapped_filter_shape(filters),
         strides,
         padding,
+        1,
         dilations,
-        (data_format, "WIO", data_format),
-        True,
+        output_shape,
     )
+    return _jitted_conv(
+        _DN_1D_TRANSPOSE,
+        data_format == "NCW",
+        strides,
+        _hashable_padding(padding),
+        dilations,
+        transpose=True,
+    )(x, filters)
 
 
 def conv2d(
@@ -114,17 +182,11 @@ def conv2d(
     dilations: Union[int, Tuple[int, int]] = 1,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    strides = [strides] * 2 if isinstance(strides, int) else strides
-    dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    return jlax.conv_general_dilated(
-        x,
-        filters,
-        strides,
-        padding,
-        None,
-        dilations,
-        (data_format, "HWIO", data_format),
-    )
+    strides = _ntuple(strides, 2)
+    dilations = _ntuple(dilations, 2)
+    return _jitted_conv(
+        _DN_2D, data_format == "NCHW", strides, _hashable_padding(padding), dilations
+    )(x, filters)
 
 
 def conv2d_transpose(
@@ -139,25 +201,29 @@ def conv2d_transpose(
     dilations: Optional[Union[int, Tuple[int, int]]] = 1,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    strides = [strides] * 2 if isinstance(strides, int) else strides
-    dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    filters = jnp.swapaxes(filters, -1, -2)
+    strides = _ntuple(strides, 2)
+    dilations = _ntuple(dilations, 2)
     if data_format == "NHWC":
         x_shape = list(x.shape[1:3])
     else:
         x_shape = list(x.shape[2:])
     padding = _get_tranpose_padding(
-        x_shape, filters.shape, strides, padding, 2, dilations, output_shape
-    )
-    return jlax.conv_transpose(
-        x,
-        filters,
+        x_shape,
+        _swapped_filter_shape(filters),
         strides,
         padding,
+        2,
         dilations,
-        (data_format, "HWIO", data_format),
-        True,
+        output_shape,
     )
+    return _jitted_conv(
+        _DN_2D_TRANSPOSE,
+        data_format == "NCHW",
+        strides,
+        _hashable_padding(padding),
+        dilations,
+        transpose=True,
+    )(x, filters)
 
 
 def depthwise_conv2d(
@@ -171,9 +237,9 @@ def depthwise_conv2d(
     dilations: Optional[Union[int, Tuple[int, int]]] = 1,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    strides = [strides] * 2 if isinstance(strides, int) else strides
+    strides = _ntuple(strides, 2)
     strides = [strides[1], strides[2]] if len(strides) == 4 else strides
-    dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
+    dilations = _ntuple(dilations, 2)
     filters = jnp.squeeze(filters, 3) if filters.ndim == 4 else filters
     cn = filters.shape[-1]
     filters = jnp.expand_dims(filters, -2)
@@ -200,17 +266,11 @@ def conv3d(
     dilations: Optional[Union[int, Tuple[int, int, int]]] = 1,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    strides = [strides] * 3 if isinstance(strides, int) else strides
-    dilations = [dilations] * 3 if isinstance(dilations, int) else dilations
-    return jlax.conv_general_dilated(
-        x,
-        filters,
-        strides,
-        padding,
-        None,
-        dilations,
-        (data_format, "DHWIO", data_format),
-    )
+    strides = _ntuple(strides, 3)
+    dilations = _ntuple(dilations, 3)
+    return _jitted_conv(
+        _DN_3D, data_format == "NCDHW", strides, _hashable_padding(padding), dilations
+    )(x, filters)
 
 
 def conv3d_transpose(
@@ -225,25 +285,29 @@ def conv3d_transpose(
     data_format: Optional[str] = "NDHWC",
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    strides = [strides] * 3 if isinstance(strides, int) else strides
-    dilations = [dilations] * 3 if isinstance(dilations, int) else dilations
-    filters = jnp.swapaxes(filters, -1, -2)
-    if data_format == "NDHWC":
-        x_shape = list(x.shape[1:4])
-    else:
+    strides = _ntuple(strides, 3)
+    dilations = _ntuple(dilations, 3)
+    if data_format == "NCDHW":
         x_shape = list(x.shape[2:])
+    else:
+        x_shape = list(x.shape[1:4])
     padding = _get_tranpose_padding(
-        x_shape, filters.shape, strides, padding, 3, dilations, output_shape
-    )
-    return jlax.conv_transpose(
-        x,
-        filters,
+        x_shape,
+        _swapped_filter_shape(filters),
         strides,
         padding,
+        3,
         dilations,
-        (data_format, "DHWIO", data_format),
-        True,
+        output_shape,
     )
+    return _jitted_conv(
+        _DN_3D_TRANSPOSE,
+        data_format == "NCDHW",
+        strides,
+        _hashable_padding(padding),
+        dilations,
+        transpose=True,
+    )(x, filters)
 
 
 def _get_filter_dataformat(dims: int = 2):
@@ -274,9 +338,9 @@ def conv_general_dilated(
     bias: Optional[JaxArray] = None,
     out: Optional[JaxArray] = None,
 ):
-    strides = [strides] * dims if isinstance(strides, int) else strides
-    dilations = [dilations] * dims if isinstance(dilations, int) else dilations
-    x_dilations = [x_dilations] * dims if isinstance(x_dilations, int) else x_dilations
+    strides = _ntuple(strides, dims)
+    dilations = _ntuple(dilations, dims)
+    x_dilations = _ntuple(x_dilations, dims)
     filter_df = _get_filter_dataformat(dims)
     if not len(x_dilations) == x_dilations.count(1):
         new_pad = [0] * dims
@@ -335,13 +399,13 @@ def conv_general_transpose(
     bias: Optional[JaxArray] = None,
     out: Optional[JaxArray] = None,
 ):
-    strides = [strides] * dims if isinstance(strides, int) else strides
-    dilations = [dilations] * dims if isinstance(dilations, int) else dilations
+    strides = _ntuple(strides, dims)
+    dilations = _ntuple(dilations, dims)
     filters = jnp.swapaxes(filters, -1, -2)
     df = _get_x_data_format(dims, "channel_last")
     filter_df = _get_filter_dataformat(dims)
     if data_format == "channel_first":
-        x = jnp.transpose(x, (0, *range(2, dims + 2), 1))
+        x = _channel_first_to_last(x, dims)
     padding = _get_tranpose_padding(
         x.shape[1:], filters.shape, strides, padding, dims, dilations, output_shape
     )
@@ -364,5 +428,5 @@ def conv_general_transpose(
     )
     res = jnp.add(res, bias) if bias is not None else res
     if data_format == "channel_first":
-        return jnp.transpose(res, (0, dims + 1, *range(1, dims + 1)))
+        return _channel_last_to_first(res, dims)
     return res
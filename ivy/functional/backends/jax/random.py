@@ -1,6 +1,7 @@
 """Collection of Jax random functions, wrapped to fit Ivy syntax and signature."""
 
 # global
+import functools
 import jax
 import jax.numpy as jnp
 import jaxlib.xla_extension
@@ -40,6 +41,13 @@ def _getRNG():
     return RNG.key
 
 
+@functools.partial(jax.jit, static_argnums=(3, 4))
+def _scaled_normal(key, mean, std, shape, dtype):
+    # sampling, scaling and shifting are compiled into a single kernel, once
+    # per shape and dtype
+    return jax.random.normal(key, shape, dtype=dtype) * std + mean
+
+
 def random_uniform(
     *,
     low: Union[float, JaxArray] = 0.0,
@@ -82,13 +90,9 @@ def random_normal(
     else:
         RNG_, rng_input = jax.random.split(_getRNG())
         _setRNG(RNG_)
-    return (
-        to_device(
-            jax.random.normal(rng_input, shape, dtype=dtype),
-            device,
-        )
-        * std
-        + mean
+    return to_device(
+        _scaled_normal(rng_input, mean, std, tuple(shape), dtype),
+        device,
     )
 
 
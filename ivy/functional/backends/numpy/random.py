@@ -80,12 +80,31 @@ def multinomial(
     num_classes = orig_probs_shape[-1]
     probs_flat = np.reshape(probs, (-1, orig_probs_shape[-1]))
     probs_flat = probs_flat / np.sum(probs_flat, -1, keepdims=True, dtype="float64")
-    probs_stack = np.split(probs_flat, probs_flat.shape[0])
-    samples_stack = [
-        np.random.choice(num_classes, num_samples, replace, p=prob[0])
-        for prob in probs_stack
-    ]
-    samples_flat = np.stack(samples_stack)
+    if replace:
+        probs_stack = np.split(probs_flat, probs_flat.shape[0])
+        samples_stack = [
+            np.random.choice(num_classes, num_samples, replace, p=prob[0])
+            for prob in probs_stack
+        ]
+        samples_flat = np.stack(samples_stack)
+    else:
+        # raise the same errors as np.random.choice does without replacement
+        if num_samples > num_classes:
+            raise ValueError(
+                "Cannot take a larger sample than population when 'replace=False'"
+            )
+        if np.any(np.isnan(probs_flat)):
+            raise ValueError("probabilities contain NaN")
+        if np.any(probs_flat < 0):
+            raise ValueError("probabilities are not non-negative")
+        if np.any(np.count_nonzero(probs_flat, axis=-1) < num_samples):
+            raise ValueError("Fewer non-zero entries in p than size")
+        # Gumbel-top-k trick: the indices of the k largest Gumbel-perturbed
+        # log-probabilities are k samples drawn without replacement, which
+        # lets every row be sampled with a single sort
+        with np.errstate(divide="ignore"):
+            scores = np.log(probs_flat) + np.random.gumbel(size=probs_flat.shape)
+        samples_flat = np.argsort(-scores, axis=-1)[:, :num_samples]
     return np.asarray(np.reshape(samples_flat, orig_probs_shape[:-1] + [num_samples]))
 
 
@@ -1,4 +1,5 @@
 # global
+import functools
 from typing import Optional, Union, Sequence, List
 
 import paddle
@@ -39,10 +40,51 @@ native_dtype_dict = {
     "bool": paddle.bool,
 }
 
+_IVY_DTYPES = {k: ivy.Dtype(v) for k, v in ivy_dtype_dict.items()}
+
+_PADDLE_TO_NUMPY = {
+    paddle.int8: np.int8,
+    paddle.int16: np.int16,
+    paddle.int32: np.int32,
+    paddle.int64: np.int64,
+    paddle.uint8: np.uint8,
+    paddle.float16: np.float16,
+    paddle.float32: np.float32,
+    paddle.float64: np.float64,
+    paddle.complex64: np.complex64,
+    paddle.complex128: np.complex128,
+    paddle.bool: np.bool_,
+}
+
+_NUMPY_TO_PADDLE = {np.dtype(v): k for k, v in _PADDLE_TO_NUMPY.items()}
+
+_DTYPE_BITS = {
+    "bool": 1,
+    "int8": 8,
+    "uint8": 8,
+    "int16": 16,
+    "float16": 16,
+    "bfloat16": 16,
+    "int32": 32,
+    "float32": 32,
+    "int64": 64,
+    "float64": 64,
+    "complex64": 64,
+    "complex128": 128,
+}
+
+# dtypes which paddle can't reshape directly when the tensor is 0-dimensional
+_RESHAPE_VIA_FLOAT32_DTYPES = frozenset({paddle.int16, paddle.float16})
+
 
 class Finfo:
     def __init__(self, paddle_finfo: np.finfo):
         self._paddle_finfo = paddle_finfo
+        # converted once, the instances are shared through the cached _finfo
+        self._eps = float(paddle_finfo.eps)
+        self._max = float(paddle_finfo.max)
+        self._min = float(paddle_finfo.min)
+        self._smallest_normal = float(paddle_finfo.tiny)
 
     def __repr__(self):
         return repr(self._paddle_finfo)
@@ -53,19 +95,19 @@ class Finfo:
 
     @property
     def eps(self):
-        return float(self._paddle_finfo.eps)
+        return self._eps
 
     @property
     def max(self):
-        return float(self._paddle_finfo.max)
+        return self._max
 
     @property
     def min(self):
-        return float(self._paddle_finfo.min)
+        return self._min
 
     @property
     def smallest_normal(self):
-        return float(self._paddle_finfo.tiny)
+        return self._smallest_normal
 
 
 class Iinfo:
@@ -115,7 +157,8 @@ def astype(
     copy: bool = True,
     out: Optional[paddle.Tensor] = None,
 ) -> paddle.Tensor:
-    dtype = ivy.as_native_dtype(dtype)
+    if not isinstance(dtype, paddle.dtype):
+        dtype = ivy.as_native_dtype(dtype)
     if x.dtype == dtype:
         return x.clone() if copy else x
     return x.cast(dtype)
@@ -130,16 +173,20 @@ def broadcast_arrays(*arrays: paddle.Tensor) -> List[paddle.Tensor]:
     new_arrays = []
     for array in arrays:
         if isinstance(array, paddle.Tensor):
-            if array.rank().item() == 0:
-                if array.dtype in [paddle.int16, paddle.float16]:
-                    array, array_dtype = array.astype('float32'), array.dtype
-                    new_arrays.append(array.unsqueeze(0).astype(array_dtype))
+            if array.ndim == 0:
+                array_dtype = array.dtype
+                if array_dtype in _RESHAPE_VIA_FLOAT32_DTYPES:
+                    array = array.astype("float32").reshape([1])
+                    new_arrays.append(array.astype(array_dtype))
                 else:
-                    new_arrays.append(array.unsqueeze(0))
+                    new_arrays.append(array.reshape([1]))
             else:
                 new_arrays.append(array)
         else:
             new_arrays.append(paddle.to_tensor(array))
+    shape = new_arrays[0].shape
+    if all(array.shape == shape for array in new_arrays[1:]):
+        return new_arrays
     return list(paddle.broadcast_tensors(new_arrays))
 
 
@@ -150,41 +197,60 @@ def broadcast_to(
     *,
     out: Optional[paddle.Tensor] = None,
 ) -> paddle.Tensor:
-    if x.ndim > len(shape):
-        return paddle.broadcast_to(x.reshape([-1]), shape)
+    if tuple(x.shape) == tuple(shape):
+        return x
+    diff = x.ndim - len(shape)
+    if diff > 0:
+        if all(d == 1 for d in x.shape[:diff]):
+            x = x.squeeze(axis=list(range(diff)))
+        else:
+            x = x.reshape([-1])
     return paddle.broadcast_to(x, shape)
 
 
+@functools.lru_cache(maxsize=None)
+def _finfo(type: paddle.dtype, /) -> Finfo:
+    if type == paddle.bfloat16:
+        return Finfo(Bfloat16Finfo())
+    return Finfo(np.finfo(_PADDLE_TO_NUMPY[type]))
+
+
 @_handle_nestable_dtype_info
 def finfo(type: Union[paddle.dtype, str, paddle.Tensor], /) -> Finfo:
     if isinstance(type, paddle.Tensor):
-        type = str(type.dtype)[7:]
-    elif isinstance(type, paddle.dtype):
-        type = str(type)[7:]
+        type = type.dtype
+    return _finfo(as_native_dtype(type))
 
-    if ivy.as_native_dtype(type) == paddle.bfloat16:
-        return Finfo(Bfloat16Finfo())
 
-    return Finfo(np.finfo(type))
+@functools.lru_cache(maxsize=None)
+def _iinfo(type: paddle.dtype, /) -> Iinfo:
+    return Iinfo(np.iinfo(_PADDLE_TO_NUMPY[type]))
 
 
 @_handle_nestable_dtype_info
 def iinfo(type: Union[paddle.dtype, str, paddle.Tensor], /) -> Iinfo:
     if isinstance(type, paddle.Tensor):
-        type = str(type.dtype)[7:]
-    elif isinstance(type, paddle.dtype):
-        type = str(type)[7:]
-
-    return Iinfo(np.iinfo(type))
+        type = type.dtype
+    return _iinfo(as_native_dtype(type))
 
 
 def result_type(*arrays_and_dtypes: Union[paddle.Tensor, paddle.dtype]) -> ivy.Dtype:
-    input = []
-    for val in arrays_and_dtypes:
-        paddle_val = as_native_dtype(val)
-        if isinstance(paddle_val, paddle.dtype):
-            paddle_val = paddle.to_tensor(1, dtype=paddle_val)
-        input.append(paddle_val)
+    dtypes = [
+        val.dtype if isinstance(val, paddle.Tensor) else as_native_dtype(val)
+        for val in arrays_and_dtypes
+    ]
+    if all(
+        isinstance(dtype, paddle.dtype) and dtype in _PADDLE_TO_NUMPY
+        for dtype in dtypes
+    ):
+        np_dtypes = [_PADDLE_TO_NUMPY[dtype] for dtype in dtypes]
+        return as_ivy_dtype(_NUMPY_TO_PADDLE[np.result_type(*np_dtypes)])
+    # bfloat16 and python scalars have no entry in the numpy table, so these are
+    # promoted by paddle itself
+    input = [
+        paddle.to_tensor(1, dtype=dtype) if isinstance(dtype, paddle.dtype) else dtype
+        for dtype in dtypes
+    ]
     temp_dtype = paddle.add(input[0], input[1]).dtype
     result = paddle.to_tensor(1, dtype=temp_dtype)
 
@@ -198,7 +264,21 @@ def result_type(*arrays_and_dtypes: Union[paddle.Tensor, paddle.dtype]) -> ivy.D
 # ------#
 
 
+@functools.lru_cache(maxsize=None)
+def _as_ivy_dtype(dtype_in: Union[paddle.dtype, str], /) -> ivy.Dtype:
+    if isinstance(dtype_in, str):
+        if dtype_in in native_dtype_dict:
+            return ivy.Dtype(dtype_in)
+        else:
+            raise ivy.utils.exceptions.IvyException(
+                "Cannot convert to ivy dtype."
+                f" {dtype_in} is not supported by Paddle backend."
+            )
+    return _IVY_DTYPES[dtype_in]
+
+
 def as_ivy_dtype(dtype_in: Union[paddle.dtype, str, bool, int, float], /) -> ivy.Dtype:
+    # the default dtypes can change at runtime, so only the pure mapping is cached
     if dtype_in is int:
         return ivy.default_int_dtype()
     if dtype_in is float:
@@ -207,20 +287,14 @@ def as_ivy_dtype(dtype_in: Union[paddle.dtype, str, bool, int, float], /) -> ivy
         return ivy.default_complex_dtype()
     if dtype_in is bool:
         return ivy.Dtype("bool")
-    if isinstance(dtype_in, str):
-        if dtype_in in native_dtype_dict:
-            return ivy.Dtype(dtype_in)
-        else:
-            raise ivy.utils.exceptions.IvyException(
-                "Cannot convert to ivy dtype."
-                f" {dtype_in} is not supported by Paddle backend."
-            )
-    return ivy.Dtype(ivy_dtype_dict[dtype_in])
+    return _as_ivy_dtype(dtype_in)
 
 
 def as_native_dtype(
     dtype_in: Union[paddle.dtype, str, bool, int, float]
 ) -> paddle.dtype:
+    if isinstance(dtype_in, paddle.dtype):
+        return dtype_in
     if dtype_in is int:
         return ivy.default_int_dtype(as_native=True)
     if dtype_in is float:
@@ -231,12 +305,12 @@ def as_native_dtype(
         return paddle.bool
     if not isinstance(dtype_in, str):
         return dtype_in
-    if dtype_in in native_dtype_dict.keys():
-        return native_dtype_dict[ivy.Dtype(dtype_in)]
-    else:
+    native_dtype = native_dtype_dict.get(dtype_in)
+    if native_dtype is None:
         raise ivy.utils.exceptions.IvyException(
             "Cannot convert to Paddle dtype." f" {dtype_in} is not supported by Paddle."
         )
+    return native_dtype
 
 
 def dtype(x: paddle.Tensor, *, as_native: bool = False) -> ivy.Dtype:
@@ -246,14 +320,4 @@ def dtype(x: paddle.Tensor, *, as_native: bool = False) -> ivy.Dtype:
 
 
 def dtype_bits(dtype_in: Union[paddle.dtype, str], /) -> int:
-    dtype_str = as_ivy_dtype(dtype_in)
-    if "bool" in dtype_str:
-        return 1
-    return int(
-        dtype_str.replace("paddle.", "")
-        .replace("uint", "")
-        .replace("int", "")
-        .replace("bfloat", "")
-        .replace("float", "")
-        .replace("complex", "")
-    )
+    return _DTYPE_BITS[as_ivy_dtype(dtype_in)]
@@ -8,6 +8,8 @@ import ivy
 from ivy.func_wrapper import with_unsupported_dtypes
 from .. import backend_version
 from paddle.fluid.libpaddle import Place
+from ivy.functional.backends.paddle.device import to_device
+from ivy.functional.ivy.random import _check_shapes_broadcastable
 
 # dirichlet
 
@@ -64,6 +66,7 @@ def poisson(
     raise IvyNotImplementedException()
 
 
+@with_unsupported_dtypes({"2.4.2 and below": ("float16", "bfloat16")}, backend_version)
 def bernoulli(
     probs: Union[float, paddle.Tensor],
     *,
@@ -74,4 +77,13 @@ def bernoulli(
     seed: Optional[int] = None,
     out: Optional[paddle.Tensor] = None,
 ) -> paddle.Tensor:
-    raise IvyNotImplementedException()
+    if seed is not None:
+        paddle.seed(seed)
+    if logits is not None:
+        probs = paddle.nn.functional.sigmoid(logits)
+    if not isinstance(probs, paddle.Tensor):
+        probs = paddle.to_tensor(probs, dtype="float32")
+    # as in the other backends, shape has to be one the probs can be broadcast to
+    # and the samples take the shape of the probs
+    _check_shapes_broadcastable(shape, probs.shape)
+    return to_device(paddle.bernoulli(probs).cast(dtype), device)
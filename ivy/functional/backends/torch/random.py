@@ -29,12 +29,14 @@ def random_uniform(
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     shape = _check_bounds_and_get_shape(low, high, shape)
-    rand_range = high - low
     if seed:
         torch.manual_seed(seed)
     if torch.is_tensor(shape):
         shape = shape.tolist()
-    return torch.rand(shape, device=device, dtype=dtype) * rand_range + low
+    if isinstance(low, (int, float)) and isinstance(high, (int, float)):
+        # scalar bounds can be applied in the sampling kernel itself
+        return torch.empty(shape, device=device, dtype=dtype).uniform_(low, high)
+    return torch.rand(shape, device=device, dtype=dtype) * (high - low) + low
 
 
 def random_normal(
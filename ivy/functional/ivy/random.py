@@ -32,6 +32,11 @@ def _check_bounds_and_get_shape(low, high, shape):
         )
         return shape
 
+    # scalar bounds draw a single value, so there is no need to resolve the
+    # array types of every backend
+    if isinstance(low, (int, float)) and isinstance(high, (int, float)):
+        return ()
+
     valid_types = (
         ivy.Array,
         ivy.get_backend("torch").NativeArray,
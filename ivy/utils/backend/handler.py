@@ -1,16 +1,17 @@
 # global
 import os
+import re
+import random
 import sys
 import copy
 import types
 import ivy
 import importlib
 import functools
-import numpy as np
+import itertools
 from typing import Optional
-import gc
+import weakref
 from ivy.utils import _importlib, verbosity
-from ivy.utils.backend import ast_helpers
 
 # local
 from ivy.func_wrapper import _wrap_function
@@ -44,6 +45,7 @@ _array_types[
 _array_types["torch"] = "ivy.functional.backends.torch"
 _array_types["torch.nn.parameter"] = "ivy.functional.backends.torch"
 _array_types["paddle"] = "ivy.functional.backends.paddle"
+_array_types = types.MappingProxyType(_array_types)
 
 
 _backend_dict = dict()
@@ -52,6 +54,26 @@ _backend_dict["jax"] = "ivy.functional.backends.jax"
 _backend_dict["tensorflow"] = "ivy.functional.backends.tensorflow"
 _backend_dict["torch"] = "ivy.functional.backends.torch"
 _backend_dict["paddle"] = "ivy.functional.backends.paddle"
+_backend_dict = types.MappingProxyType(_backend_dict)
+
+# the backend module (or None) for each leaf type seen when inferring the backend
+_type_to_backend = dict()
+
+# weak references to the live ivy.Array instances which have dynamic_backend
+# enabled and to every live ivy.Container, so that dynamic backend conversion
+# doesn't need to scan all objects tracked by the gc. Containers are registered
+# regardless of dynamic_backend as the arrays they hold mustn't be converted alone
+_live_arrays = weakref.WeakValueDictionary()
+_live_containers = weakref.WeakValueDictionary()
+
+
+def _track_array(x):
+    _live_arrays[id(x)] = x
+
+
+def _track_container(cont):
+    _live_containers[id(cont)] = cont
+
 
 _backend_reverse_dict = dict()
 _backend_reverse_dict["ivy.functional.backends.numpy"] = "numpy"
@@ -64,6 +86,11 @@ _backend_reverse_dict["ivy.functional.backends.paddle"] = "paddle"
 # ----------------------- #
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_import(module_name):
+    return importlib.import_module(module_name)
+
+
 def prevent_access_locally(fn):
     @functools.wraps(fn)
     def new_fn(*args, **kwargs):
@@ -98,30 +125,52 @@ def _determine_backend_from_args(args):
     <module 'ivy.functional.backends.jax' from '/ivy/ivy/functional/backends/jax/__init__.py'>    # noqa
 
     """
-    arg_type = type(args)
-    if isinstance(args, ivy.Array):
-        args = args.data
-
-    if isinstance(args, dict):
-        for key, value in args.items():
-            # recursively call the function for each value in the dictionary
-            lib = _determine_backend_from_args(value)
-            if lib:
-                return lib
-        # check if args is a list or tuple
-    elif arg_type in [list, tuple]:
-        for arg in args:
-            # recursively call the function for each element in the list/tuple
-            lib = _determine_backend_from_args(arg)
-            if lib:
-                return lib
-    else:
-        # check if the class module of the arg is in _array_types
-        if args.__class__.__module__ in _array_types:
-            module_name = _array_types[args.__class__.__module__]
-            return importlib.import_module(module_name)
+    # depth-first traversal with an explicit stack, where each container's
+    # items are pushed in reverse so that they're visited in their original order
+    stack = [args]
+    while stack:
+        arg = stack.pop()
+        if isinstance(arg, ivy.Array):
+            arg = arg.data
+        arg_type = type(arg)
+
+        # isinstance is kept for dicts so that ivy.Container is traversed too
+        if isinstance(arg, dict):
+            stack.extend(reversed(list(arg.values())))
+        elif arg_type is list or arg_type is tuple:
+            stack.extend(reversed(arg))
+        else:
+            # check if the class module of the arg is in _array_types
+            arg_class = arg.__class__
+            if arg_class not in _type_to_backend:
+                module_name = _array_types.get(arg_class.__module__)
+                _type_to_backend[arg_class] = (
+                    None if module_name is None else _cached_import(module_name)
+                )
+            backend = _type_to_backend[arg_class]
+            if backend is not None:
+                return backend
+
 
+_version_specific_fn_name_re = re.compile(
+    r"^(?P<base>.+?)_v_(?P<start>\d+(?:p\d+)*)"
+    r"(?:_to_(?P<end>\d+(?:p\d+)*)|_and_(?P<bound>above|below))$"
+)
 
+
+def _version_tuple(version_str, sep="p"):
+    return tuple(int(v) for v in version_str.split(sep))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_version(version):
+    version = str(version)
+    if version.find("+") != -1:
+        version = version[: version.index("+")]
+    return _version_tuple(version, sep=".")
+
+
+@functools.lru_cache(maxsize=4096)
 def fn_name_from_version_specific_fn_name(name, version):
     """
     Parameters
@@ -139,34 +188,19 @@ def fn_name_from_version_specific_fn_name(name, version):
 
     """
     # TODO: add tests
-    version = str(version)
-    if version.find("+") != -1:
-        version = tuple(map(int, version[: version.index("+")].split(".")))
-    else:
-        version = tuple(map(int, version.split(".")))
-    if "_to_" in name:
-        i = name.index("_v_")
-        e = name.index("_to_")
-        version_start = name[i + 3 : e]
-        version_start = tuple(map(int, version_start.split("p")))
-        version_end = name[e + 4 :]
-        version_end = tuple(map(int, version_end.split("p")))
-        if version_start <= version <= version_end:
-            return name[0:i]
-    elif "_and_above" in name:
-        i = name.index("_v_")
-        e = name.index("_and_")
-        version_start = name[i + 3 : e]
-        version_start = tuple(map(int, version_start.split("p")))
+    match = _version_specific_fn_name_re.match(name)
+    if match is None:
+        return None
+    version = _parse_version(version)
+    version_start = _version_tuple(match.group("start"))
+    if match.group("end") is not None:
+        if version_start <= version <= _version_tuple(match.group("end")):
+            return match.group("base")
+    elif match.group("bound") == "above":
         if version >= version_start:
-            return name[0:i]
-    else:
-        i = name.index("_v_")
-        e = name.index("_and_")
-        version_start = name[i + 3 : e]
-        version_start = tuple(map(int, version_start.split("p")))
-        if version <= version_start:
-            return name[0:i]
+            return match.group("base")
+    elif version <= version_start:
+        return match.group("base")
 
 
 def set_backend_to_specific_version(backend):
@@ -246,7 +280,7 @@ def current_backend(*args, **kwargs):
         return f
     if verbosity.level > 0:
         verbosity.cprint("Using backend from type: {}".format(f))
-    return importlib.import_module(_backend_dict[implicit_backend])
+    return _cached_import(_backend_dict[implicit_backend])
 
 
 def _set_backend_as_ivy(
@@ -256,30 +290,73 @@ def _set_backend_as_ivy(
         backend.invalid_dtypes if invalid_dtypes is None else invalid_dtypes
     )
     backend_str = backend.current_backend_str() if backend_str is None else backend_str
+    backend_init_file = os.path.join(backend_str, "__init__.py")
+    target_dict = target.__dict__
+    backend_dict = backend.__dict__
     for k, v in original_dict.items():
-        compositional = k not in backend.__dict__
-        if k not in backend.__dict__:
-            if k in invalid_dtypes and k in target.__dict__:
-                del target.__dict__[k]
+        compositional = k not in backend_dict
+        if compositional:
+            if k in invalid_dtypes and k in target_dict:
+                del target_dict[k]
                 continue
-            backend.__dict__[k] = v
-        target.__dict__[k] = _wrap_function(
-            key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
+            backend_dict[k] = v
+        target_dict[k] = _wrap_function(
+            key=k, to_wrap=backend_dict[k], original=v, compositional=compositional
         )
         if (
             isinstance(v, types.ModuleType)
-            and "ivy.functional." in v.__name__
-            and os.path.join("{}", "__init__.py").format(backend_str) not in v.__file__
+            and v.__name__.startswith("ivy.functional.")
+            and backend_init_file not in v.__file__
         ):
             _set_backend_as_ivy(
                 v.__dict__,
-                target.__dict__[k],
-                backend.__dict__[k],
+                target_dict[k],
+                backend_dict[k],
                 invalid_dtypes=invalid_dtypes,
                 backend_str=backend_str,
             )
 
 
+# the ivy namespace produced by _set_backend_as_ivy for each (target, backend)
+# pair, along with the original dict it was produced from
+_set_backend_cache = dict()
+
+
+def _set_backend_as_ivy_cached(original_dict, target, backend):
+    key = (target, backend)
+    if key in _set_backend_cache:
+        original_items, wrapped, removed = _set_backend_cache[key]
+        # the cached namespace is only valid if the original dict is unchanged
+        if len(original_items) == len(original_dict) and all(
+            k in original_dict and original_dict[k] is v for k, v in original_items
+        ):
+            for k in removed:
+                target.__dict__.pop(k, None)
+            target.__dict__.update(wrapped)
+            return
+    _set_backend_as_ivy(original_dict, target, backend)
+    wrapped = {k: target.__dict__[k] for k in original_dict if k in target.__dict__}
+    removed = tuple(k for k in original_dict if k not in target.__dict__)
+    _set_backend_cache[key] = (tuple(original_dict.items()), wrapped, removed)
+
+
+# the wrapper produced by _wrap_function for each (key, to_wrap, original) triple
+# when restoring a previous backend, along with the objects it was built from
+_wrap_cache = dict()
+
+
+def _cached_wrap_function(key, to_wrap, original):
+    cache_key = (key, id(to_wrap), id(original))
+    if cache_key in _wrap_cache:
+        cached_to_wrap, cached_original, wrapped = _wrap_cache[cache_key]
+        # the ids are only valid while the cached objects are the ones passed
+        if cached_to_wrap is to_wrap and cached_original is original:
+            return wrapped
+    wrapped = _wrap_function(key, to_wrap, original)
+    _wrap_cache[cache_key] = (to_wrap, original, wrapped)
+    return wrapped
+
+
 def _handle_backend_specific_vars(backend):
     if backend.current_backend_str() == "numpy":
         backend.set_default_device("cpu")
@@ -318,13 +395,12 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs):
             return _is_variable(obj)
 
     def _remove_intermediate_arrays(arr_list, cont_list):
-        cont_list = [cont.cont_to_flat_list() for cont in cont_list]
-
-        cont_ids = [
+        cont_ids = {
             id(item.data) if isinstance(item, ivy.Array) else id(item)
-            for cont in cont_list
-            for item in cont
-        ]
+            for item in itertools.chain.from_iterable(
+                cont.cont_to_flat_list() for cont in cont_list
+            )
+        }
         arr_ids = [
             id(item.data) if isinstance(item, ivy.Array) else id(item)
             for item in arr_list
@@ -335,13 +411,9 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs):
         return list(new_objs.values())
 
     # get all ivy array and container instances in the project scope
-    array_list, container_list = [
-        [obj for obj in gc.get_objects() if isinstance(obj, obj_type)]
-        for obj_type in (ivy.Array, ivy.Container)
-    ]
-
-    # filter uninitialized arrays
-    array_list = [arr for arr in array_list if arr.__dict__]
+    # (only arrays which have finished initializing are registered)
+    array_list = list(_live_arrays.values())
+    container_list = list(_live_containers.values())
 
     # remove numpy intermediate objects
     new_objs = _remove_intermediate_arrays(array_list, container_list)
@@ -375,19 +447,14 @@ def convert_from_numpy_to_target_backend(variable_ids, numpy_objs):
 
     # convert all ivy.Array and ivy.Container instances from numpy
     # to native arrays using the newly set backend
-    for obj in numpy_objs:
-        np_arr = obj.data if isinstance(obj, ivy.Array) else obj
+    asarray = current_backend().asarray
+    np_arrs = [obj.data if isinstance(obj, ivy.Array) else obj for obj in numpy_objs]
+    # a single nested_map over all of the objects, rather than one call per object
+    converted = ivy.nested_map(np_arrs, asarray, include_derived=True, shallow=False)
+    for obj, new_data in zip(numpy_objs, converted):
         # check if object was originally a variable
         if id(obj) in variable_ids:
-            native_arr = ivy.nested_map(
-                np_arr, current_backend().asarray, include_derived=True, shallow=False
-            )
-            new_data = _variable(native_arr)
-
-        else:
-            new_data = ivy.nested_map(
-                np_arr, current_backend().asarray, include_derived=True, shallow=False
-            )
+            new_data = _variable(new_data)
 
         if isinstance(obj, ivy.Container):
             obj.cont_inplace_update(new_data)
@@ -441,7 +508,7 @@ def set_backend(backend: str, dynamic: bool = False):
         temp_stack = list()
         while backend_stack:
             temp_stack.append(unset_backend())
-        backend = importlib.import_module(_backend_dict[backend])
+        backend = _cached_import(_backend_dict[backend])
         for fw in reversed(temp_stack):
             backend_stack.append(fw)
     if backend.current_backend_str() == "numpy":
@@ -450,7 +517,7 @@ def set_backend(backend: str, dynamic: bool = False):
         ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
     backend_stack.append(backend)
     set_backend_to_specific_version(backend)
-    _set_backend_as_ivy(ivy_original_dict, ivy, backend)
+    _set_backend_as_ivy_cached(ivy_original_dict, ivy, backend)
 
     if dynamic:
         convert_from_numpy_to_target_backend(variable_ids, numpy_objs)
@@ -529,10 +596,10 @@ def get_backend(backend: Optional[str] = None):
         if not backend_stack:
             return ""
     elif isinstance(backend, str):
-        backend = importlib.import_module(_backend_dict[backend])
+        backend = _cached_import(_backend_dict[backend])
+    backend_dict_setdefault = backend.__dict__.setdefault
     for k, v in ivy_original_dict.items():
-        if k not in backend.__dict__:
-            backend.__dict__[k] = v
+        backend_dict_setdefault(k, v)
     return backend
 
 
@@ -592,7 +659,7 @@ def unset_backend():
         # to ivy namespace
         for k, v in new_backend_dict.items():
             if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
+                v = _cached_wrap_function(k, v, ivy_original_dict[k])
             if k in ivy_original_dict:
                 ivy.__dict__[k] = v
     if verbosity.level > 0:
@@ -609,28 +676,23 @@ def clear_backend_stack():
 @prevent_access_locally
 def choose_random_backend(excluded=None):
     excluded = list() if excluded is None else excluded
-    while True:
-        ivy.utils.assertions.check_equal(
-            len(excluded),
-            4,
-            inverse=True,
-            message="""Unable to select backend, all backends are excluded,\
-            or not installed.""",
-        )
-        f = np.random.choice(
-            [f_srt for f_srt in list(_backend_dict.keys()) if f_srt not in excluded]
-        )
-        if f is None:
-            excluded.append(f)
-            continue
-        else:
-            print("\nselected backend: {}\n".format(f))
-            return f
+    candidates = [f_str for f_str in _backend_dict.keys() if f_str not in excluded]
+    ivy.utils.assertions.check_true(
+        len(candidates) > 0,
+        message="""Unable to select backend, all backends are excluded,\
+        or not installed.""",
+    )
+    f = random.choice(candidates)
+    print("\nselected backend: {}\n".format(f))
+    return f
 
 
 # noinspection PyProtectedMember
 @prevent_access_locally
 def with_backend(backend: str):
+    # imported here as importing ast_helpers scans the ivy package directory
+    from ivy.utils.backend import ast_helpers
+
     # TODO do error handling if finder fails
     finder = ast_helpers.IvyPathFinder()
     sys.meta_path.insert(0, finder)
@@ -1,4 +1,5 @@
 # general
+import functools
 import importlib
 import inspect
 from typing import List
@@ -108,15 +109,23 @@ def num_positional_args(draw, *, fn_name: str = None):
         num_positional_args=num_positional_args(fn_name="add")
     )
     """
-    num_positional_only = 0
-    num_keyword_only = 0
-    total = 0
     fn = None
     for i, fn_name_key in enumerate(fn_name.split(".")):
         if i == 0:
             fn = ivy.__dict__[fn_name_key]
         else:
             fn = fn.__dict__[fn_name_key]
+    min_value, max_value = _num_positional_args_bounds(fn)
+    return draw(nh.ints(min_value=min_value, max_value=max_value))
+
+
+@functools.lru_cache(maxsize=None)
+def _num_positional_args_bounds(fn):
+    # the signature is inspected once per function object rather than on every draw,
+    # keyed by the object itself as it changes whenever the backend does
+    num_positional_only = 0
+    num_keyword_only = 0
+    total = 0
     for param in inspect.signature(fn).parameters.values():
         if param.name == "self":
             continue
@@ -127,9 +136,7 @@ def num_positional_args(draw, *, fn_name: str = None):
             num_keyword_only += 1
         elif param.kind == param.VAR_KEYWORD:
             num_keyword_only += 1
-    return draw(
-        nh.ints(min_value=num_positional_only, max_value=(total - num_keyword_only))
-    )
+    return num_positional_only, total - num_keyword_only
 
 
 # Decorators helpers
@@ -1,6 +1,8 @@
 """Collection of tests for unified reduction functions."""
 
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st
 
 # local
@@ -215,6 +217,45 @@ def test_multinomial(
         assert u.shape == v.shape
 
 
+@pytest.mark.parametrize(
+    "num_samples, probs",
+    [
+        # more samples than classes
+        (4, [[0.2, 0.3, 0.5]]),
+        # fewer non-zero probabilities than samples
+        (3, [[0.5, 0.0, 0.5], [0.2, 0.3, 0.5]]),
+        # negative probabilities
+        (2, [[0.6, -0.1, 0.5]]),
+        # nan probabilities
+        (2, [[0.5, float("nan"), 0.5]]),
+    ],
+)
+def test_multinomial_without_replacement_errors(num_samples, probs):
+    ivy.set_backend("numpy")
+    try:
+        probs = ivy.array(np.array(probs, dtype="float32"))
+        with pytest.raises(ValueError):
+            ivy.multinomial(3, num_samples, probs=probs, replace=False)
+    finally:
+        ivy.unset_backend()
+
+
+def test_multinomial_without_replacement_samples():
+    ivy.set_backend("numpy")
+    try:
+        probs = np.random.uniform(size=(16, 8)).astype("float32")
+        probs[:, ::2] = 0
+        samples = ivy.to_numpy(
+            ivy.multinomial(8, 4, probs=ivy.array(probs), replace=False)
+        )
+        for row in samples:
+            # every sample in a row is unique and has a nonzero probability
+            assert len(set(row.tolist())) == 4
+            assert np.all(row % 2 == 1)
+    finally:
+        ivy.unset_backend()
+
+
 @st.composite
 def _gen_randint_data(draw):
     dtype = draw(helpers.get_dtypes("signed_integer", full=False))
@@ -7,6 +7,10 @@ from hypothesis import strategies as st, assume
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 
+# strategies shared by the composites below instead of being rebuilt on each draw
+float_dtypes = helpers.get_dtypes("float")
+numeric_dtypes = helpers.get_dtypes("numeric")
+
 
 @st.composite
 def statistical_dtype_values(draw, *, function, min_value=None, max_value=None):
@@ -17,7 +21,7 @@ def statistical_dtype_values(draw, *, function, min_value=None, max_value=None):
         small_abs_safety_factor = 24
     dtype, values, axis = draw(
         helpers.dtype_values_axis(
-            available_dtypes=helpers.get_dtypes("float"),
+            available_dtypes=float_dtypes,
             large_abs_safety_factor=large_abs_safety_factor,
             small_abs_safety_factor=small_abs_safety_factor,
             safety_factor_scale="log",
@@ -33,7 +37,7 @@ def statistical_dtype_values(draw, *, function, min_value=None, max_value=None):
     )
     shape = values[0].shape
     size = values[0].size
-    max_correction = np.min(shape)
+    max_correction = min(shape)
     if any(ele in function for ele in ["std", "var", "nanstd"]):
         if size == 1:
             correction = 0
@@ -54,7 +58,7 @@ def statistical_dtype_values(draw, *, function, min_value=None, max_value=None):
 
 @st.composite
 def _get_castable_dtype(draw):
-    available_dtypes = helpers.get_dtypes("numeric")
+    available_dtypes = numeric_dtypes
     shape = draw(helpers.get_shape(min_num_dims=1, max_num_dims=4, max_dim_size=6))
     dtype, values = draw(
         helpers.dtype_and_values(
@@ -271,6 +271,6 @@ def test_bernoulli(
         test_values=False,
         probs=probs[0],
         logits=None,
-        shape=None,
+        shape=probs[0].shape,
         seed=seed,
     )